@@ -1,32 +1,94 @@
-import collections
+from __future__ import annotations
+
 import datetime
 import json
 import os
 import pathlib
-import pytz
+import sys
 import typing
 import functools
 import operator
-import re
+import zoneinfo
 
 NAME = "Jared"
 
 GLOBAL_SUMMARY = f'{NAME}\'s Work'
 DEFAULT_LOCATION = "800 N State College Blvd, Fullerton, CA 92831"
+DEFAULT_TIMEZONE = "America/Los_Angeles"
+
+# partial response selector for events().list(fields=...), only what from_triple needs
+EVENT_FIELDS = "items(start/dateTime,end/dateTime,summary,location)"
+
+_ONE_MINUTE = datetime.timedelta(minutes=1)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_tz(name: str) -> zoneinfo.ZoneInfo:
+    """
+    Resolve a time zone name once and reuse the tzinfo object afterwards
+
+    Args:
+        name (str): name of the time zone, such as America/Los_Angeles
+
+    Returns:
+        zoneinfo.ZoneInfo: the cached time zone object
+    """
+
+    return zoneinfo.ZoneInfo(name)
+
+
+def _fast_iso(date_str: str) -> datetime.datetime:
+    """
+    Parse a YYYY-MM-DDTHH:MM:SS string by slicing its fixed field positions
+
+    Args:
+        date_str (str): ISO 8601 representation of a date and time
+
+    Returns:
+        datetime.datetime: the parsed datetime, falling back to fromisoformat for any other shape
+                           (aware if the string carries an offset or Z)
+    """
+
+    if (len(date_str) == 19 and date_str[4] == date_str[7] == '-' and
+            date_str[10] == 'T' and date_str[13] == date_str[16] == ':'):
+        try:
+            return datetime.datetime(
+                int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19])
+            )
+        except ValueError:
+            pass
+
+    # fromisoformat only accepts a trailing Z from Python 3.11 onwards
+    if date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
 
+    return datetime.datetime.fromisoformat(date_str)
 
+
+@functools.total_ordering
 class EventPacket():
 
+    __slots__ = ('begin', 'end', 'summary', 'sample_interval_utc',
+                 'timezone', 'location', '_tz', '_fmt_cache', '_body_cache')
+
+    # key for list.sort/sorted, the C level attrgetter avoids calling __lt__ per comparison
+    # orders exactly like __lt__, summary is included so ordering agrees with __eq__
+    # usage: events.sort(key=EventPacket.sort_key)
+    sort_key = operator.attrgetter('begin', 'end', 'summary')
+
     def __init__(self, interval: typing.Tuple[datetime.datetime, datetime.datetime],
                  summary: str = GLOBAL_SUMMARY,
                  sample_interval_utc: typing.Tuple[bool, str] = (
-                     False, "America/Los_Angeles")
+                     False, DEFAULT_TIMEZONE),
                  location: str = DEFAULT_LOCATION):
         """
         Class constructor for EventPacket
 
         Args:
             interval (typing.Tuple): time interval in which the event will be taking place
+                                     naive datetimes are taken as wall clock time in the provided timezone
+                                     aware datetimes are converted to that timezone and stored as naive wall clock time
             summary (str): summary of the event
             sample_interval_utc (typing.Tuple[bool, str]): does the constructor assume the event is happening in the same
                                                            UTC time zone as the creator of the object
@@ -38,15 +100,21 @@ class EventPacket():
             EventPacket: an EventPacket instance
         """
 
-        if not(isinstance(interval, tuple) or
-               isinstance(summary, str)):
-
-            raise ValueError
-
-        self.begin, self.end = interval
-        self.summary = summary
-        self.sample_interval_utc, self.timezone = sample_interval_utc
-        self.location = location
+        if type(interval) is not tuple or type(summary) is not str:
+            raise TypeError
+
+        begin, end = interval
+        # interned so events sharing the module defaults share one string and compare by identity first
+        self.summary = sys.intern(summary)
+        self.sample_interval_utc, timezone = sample_interval_utc
+        self.timezone = sys.intern(timezone) if type(timezone) is str else timezone
+        self.location = sys.intern(location) if type(location) is str else location
+        self._tz = _get_tz(self.timezone)
+        # aware inputs (e.g. API dateTime values with an offset or Z) are stored as naive wall clock time in self.timezone
+        self.begin = begin if begin.tzinfo is None else begin.astimezone(self._tz).replace(tzinfo=None)
+        self.end = end if end.tzinfo is None else end.astimezone(self._tz).replace(tzinfo=None)
+        self._fmt_cache = None
+        self._body_cache = None
 
     @classmethod
     def from_string(cls, interval: typing.Tuple[str, str], summary: str):
@@ -60,16 +128,33 @@ class EventPacket():
             EventPacket: an EventPacket instance
         """
 
-        if not(isinstance(interval, tuple) or
-               isinstance(summary, str)):
-            raise ValueError
+        if type(interval) is not tuple or type(summary) is not str:
+            raise TypeError
 
         return cls(
-            map(lambda date_str: datetime.datetime.strptime(
-                date_str, "%Y-%m-%dT%H:%M:%S"), interval),
+            tuple(_fast_iso(date_str) for date_str in interval),
             summary
         )
 
+    @classmethod
+    def from_triple(cls, start: str, end: str, summary: str,
+                    location: str = DEFAULT_LOCATION):
+        """
+        Build an event from already extracted start, end and summary strings
+        Pair with EVENT_FIELDS so the Google Calendar API only returns these fields
+
+        Args:
+            start (str): start of the event as a str representation
+            end (str): end of the event as a str representation
+            summary (str): summary of the event
+            location (str): where the event is taking place
+
+        Returns:
+            EventPacket: an EventPacket instance
+        """
+
+        return cls((_fast_iso(start), _fast_iso(end)), summary, location=location)
+
     @classmethod
     def from_dict(cls, body: typing.Dict):
         """
@@ -82,11 +167,10 @@ class EventPacket():
             EventPacket: an EventPacket instance
         """
 
-        if not(isinstance(body, typing.Dict)):
-            raise ValueError
+        if not(isinstance(body, dict)):
+            raise TypeError
 
-        return EventPacket.from_string(operator.itemgetter("start", "end")(body),
-                                       body['summary'])
+        return cls.from_triple(body['start'], body['end'], body['summary'])
 
     @classmethod
     def from_freebusy(cls, response: typing.Dict):
@@ -101,8 +185,27 @@ class EventPacket():
             EventPacket: an EventPacket instance
         """
 
-        return EventPacket.from_string(response['start']['dateTime'],
-                                       response['end']['dateTime'], response['summary'])
+        return cls.from_triple(response['start']['dateTime'],
+                               response['end']['dateTime'], response['summary'],
+                               response.get('location', DEFAULT_LOCATION))
+
+    @classmethod
+    def from_freebusy_many(cls, responses: typing.List[typing.Dict]):
+        """
+        Get start and end from many dictionary/json responses at once,
+        parsing every date in a single vectorized pass (requires numpy)
+        Call to_packets(EventPacket) on the result if individual instances are needed
+
+        Args:
+            responses (typing.List[typing.Dict]): event information in dictionary containers from the Google Calendar API
+
+        Returns:
+            EventPacketBatch: the events as columns
+        """
+
+        from event_packet_batch import EventPacketBatch
+
+        return EventPacketBatch.from_freebusy_list(responses)
 
     def __eq__(self, rhs: EventPacket) -> bool:
         """
@@ -112,11 +215,11 @@ class EventPacket():
             rhs (EventPacket): another EventPacket instance
 
         Returns:
-            bool: comparision of the two objects
+            bool: comparision of the two objects, NotImplemented for other types
         """
 
         if not(isinstance(rhs, EventPacket)):
-            raise ValueError(f'Cannot compare EventPacket to {type(rhs)}')
+            return NotImplemented
 
         return (
             (self.begin, self.end) == (rhs.begin, rhs.end) and
@@ -131,16 +234,14 @@ class EventPacket():
             rhs (EventPacket): another EventPacket instance
 
         Returns:
-            bool: True denotes lhs is before rhs and vice versa
+            bool: True denotes lhs starts before rhs, ties are broken by which ends first and then by summary
+                  so that exactly one of <, == and > holds, NotImplemented for other types
         """
 
         if not(isinstance(rhs, EventPacket)):
-            raise ValueError(f'Cannot compare EventPacket to {type(rhs)}')
+            return NotImplemented
 
-        return (
-            self.begin < rhs.begin and
-            self.end < self.end
-        )
+        return (self.begin, self.end, self.summary) < (rhs.begin, rhs.end, rhs.summary)
 
     def prettify(self, time_object: datetime.datetime) -> str:
         """
@@ -164,20 +265,34 @@ class EventPacket():
 
         return f"""
                Summary: {self.summary}
-               Start: {self.prettify(self.interval[0])}
-               End: {self.interval[1]}
+               Start: {self.prettify(self.begin)}
+               End: {self.prettify(self.end)}
                """
 
-    def google_calendar_format(self) -> typing.List[str, str]:
+    @property
+    def google_calendar_format(self) -> typing.Tuple[str, str]:
         """
-        Returns a list of string objects (len of 2) that can be passed to form_submit_body
+        Returns a tuple of string objects (len of 2) in the format used by the Google Calendar API
+        The result is computed once per instance and reused afterwards
         """
 
-        current_offset = self.utc_offset(self.interval[0])
+        if self._fmt_cache is None:
+            self._fmt_cache = self._format_interval()
+
+        return self._fmt_cache
+
+    def _format_interval(self) -> typing.Tuple[str, str]:
+        """
+        Format begin and end for the Google Calendar API
+
+        Returns:
+            typing.Tuple[str, str]: formatted start and end of the event
+        """
 
-        return list(
-            map(lambda x: x.strftime(
-                f"%Y-%m-%dT%H:%M:%S{current_offset}"), (self.begin, self.end))
+        # each endpoint carries its own offset, an event may span a DST change
+        return (
+            self.begin.isoformat(timespec='seconds') + self.utc_offset(self.begin),
+            self.end.isoformat(timespec='seconds') + self.utc_offset(self.end)
         )
 
     def utc_offset(self, time_object: datetime.datetime) -> str:
@@ -191,15 +306,10 @@ class EventPacket():
             str: string representation of the UTC offset
         """
 
-        _expression = re.compile("(\-\d{2})(\d{2})")
-
-        current_offset = pytz.timezone(
-            self.timezone).localize(time_object).strftime('%z')
-
-        if not ((match := _expression.match(current_offset))):
-            raise ValueError(f"Failed to parse UTC offset of {current_offset}")
+        offset = time_object.replace(tzinfo=self._tz).utcoffset() // _ONE_MINUTE
+        hours, minutes = divmod(abs(offset), 60)
 
-        return ':'.join(match.groups())
+        return f"{'-' if offset < 0 else '+'}{hours:02d}:{minutes:02d}"
 
     @property
     def time_elapsed(self) -> int:
@@ -212,20 +322,25 @@ class EventPacket():
 
         return (self.end - self.begin).total_seconds()
 
-    def form_submit_body(self):
+    @property
+    def form_submit_body(self) -> str:
         """
         Return a json body that will be used for submitting to the Google Calendar API
+        The body is serialized once per instance and reused afterwards
         """
 
-        body = [
-            ('summary', self.summary,
-            ('start', {'dateTime': self.google_calendar_format()
-            [0], 'timeZone': self.timezone}),
-            ('end', {'dateTime': self.google_calendar_format()
-            [1], 'timeZone': self.timezone}),
-            ('location', self.location)
-        ]
-        return json.dumps(collections.OrderedDict(body), indent=4)
+        if self._body_cache is None:
+            start, end = self.google_calendar_format
+
+            body = {
+                'summary': self.summary,
+                'start': {'dateTime': start, 'timeZone': self.timezone},
+                'end': {'dateTime': end, 'timeZone': self.timezone},
+                'location': self.location
+            }
+            self._body_cache = json.dumps(body)
+
+        return self._body_cache
 
     # def google_date_added_string(self):
         # """
@@ -0,0 +1,163 @@
+# numpy is an optional dependency, only needed by this module
+# event_packet imports it lazily from EventPacket.from_freebusy_many
+import datetime
+import numpy as np
+import typing
+
+from event_packet import DEFAULT_LOCATION, DEFAULT_TIMEZONE
+
+_NO_OFFSET = np.timedelta64('NaT', 's')
+
+
+def _suffix_offset(suffix: str) -> np.timedelta64:
+    """
+    Get the UTC offset encoded by whatever follows the seconds field of an ISO 8601 string
+
+    Args:
+        suffix (str): optional fraction, then Z, +HH:MM, -HH:MM or nothing
+
+    Returns:
+        np.timedelta64: the offset, NaT when the string carries none
+    """
+
+    suffix = suffix.lstrip('.0123456789')
+
+    if not suffix:
+        return _NO_OFFSET
+
+    if suffix == 'Z':
+        return np.timedelta64(0, 's')
+
+    seconds = int(suffix[1:3]) * 3600 + int(suffix[-2:]) * 60
+    return np.timedelta64(-seconds if suffix[0] == '-' else seconds, 's')
+
+
+def _parse_columns(date_strs: typing.List[str]) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse many ISO 8601 strings into wall clock and offset columns
+
+    Args:
+        date_strs (typing.List[str]): ISO 8601 representations of dates and times
+
+    Returns:
+        typing.Tuple[np.ndarray, np.ndarray]: wall clock as datetime64[s] and offset as timedelta64[s] (NaT if naive)
+    """
+
+    wall_clock = np.array([date_str[:19] for date_str in date_strs], dtype='datetime64[s]')
+
+    # responses share a handful of offsets, so only the distinct suffixes are parsed in Python
+    suffixes, inverse = np.unique([date_str[19:] for date_str in date_strs], return_inverse=True)
+    offsets = np.array([_suffix_offset(suffix) for suffix in suffixes], dtype='timedelta64[s]')
+
+    return wall_clock, offsets[inverse]
+
+
+class EventPacketBatch():
+
+    def __init__(self, begin: np.ndarray, end: np.ndarray,
+                 begin_offset: np.ndarray, end_offset: np.ndarray,
+                 summary: np.ndarray, location: np.ndarray,
+                 timezone: str = DEFAULT_TIMEZONE):
+        """
+        Class constructor for EventPacketBatch, a column oriented container for many events
+
+        Args:
+            begin (np.ndarray): start of every event as wall clock datetime64[s]
+            end (np.ndarray): end of every event as wall clock datetime64[s]
+            begin_offset (np.ndarray): UTC offset of every start as timedelta64[s], NaT keeps the wall clock as is
+            end_offset (np.ndarray): UTC offset of every end as timedelta64[s], NaT keeps the wall clock as is
+            summary (np.ndarray): summary of every event as an object array
+            location (np.ndarray): location of every event as an object array
+            timezone (str): time zone of the events once converted by to_packets
+
+        Returns:
+            EventPacketBatch: an EventPacketBatch instance
+        """
+
+        if not(len(begin) == len(end) == len(begin_offset) == len(end_offset) ==
+               len(summary) == len(location)):
+            raise ValueError('All columns of an EventPacketBatch must be the same length')
+
+        self.begin = begin.astype('datetime64[s]')
+        self.end = end.astype('datetime64[s]')
+        self.begin_offset = begin_offset.astype('timedelta64[s]')
+        self.end_offset = end_offset.astype('timedelta64[s]')
+        self.summary = summary
+        self.location = location
+        self.timezone = timezone
+
+    @classmethod
+    def from_freebusy_list(cls, responses: typing.List[typing.Dict],
+                           timezone: str = DEFAULT_TIMEZONE):
+        """
+        Get start and end from a list of dictionary/json responses, parsing every date in one pass
+
+        Args:
+            responses (typing.List[typing.Dict]): event information in dictionary containers from the Google Calendar API
+            timezone (str): time zone of the events
+
+        Returns:
+            EventPacketBatch: an EventPacketBatch instance
+        """
+
+        begin, begin_offset = _parse_columns([response['start']['dateTime'] for response in responses])
+        end, end_offset = _parse_columns([response['end']['dateTime'] for response in responses])
+
+        return cls(
+            begin, end, begin_offset, end_offset,
+            np.array([response['summary']
+                      for response in responses], dtype=object),
+            np.array([response.get('location', DEFAULT_LOCATION)
+                      for response in responses], dtype=object),
+            timezone
+        )
+
+    def __len__(self) -> int:
+        """
+        Get how many events are held in the batch
+
+        Returns:
+            int: number of events
+        """
+
+        return len(self.begin)
+
+    def time_elapsed(self) -> np.ndarray:
+        """
+        Get how long every event is in seconds, using the offsets where both ends carry one
+
+        Returns:
+            np.ndarray: duration of each event
+        """
+
+        elapsed = (self.end - self.end_offset) - (self.begin - self.begin_offset)
+        elapsed = np.where(np.isnat(elapsed), self.end - self.begin, elapsed)
+
+        return elapsed.astype('timedelta64[s]').astype(int)
+
+    def to_packets(self, packet_cls: typing.Type) -> typing.List:
+        """
+        Convert the batch back into individual EventPacket instances
+        This is slower than building the packets with EventPacket.from_freebusy directly,
+        use it when a batch already exists rather than as a faster constructor
+
+        Args:
+            packet_cls (typing.Type): the EventPacket class to instantiate, passed in by the caller
+                                      so this module never imports it back from event_packet
+
+        Returns:
+            typing.List[EventPacket]: an EventPacket instance per event in the batch
+        """
+
+        def _attach(wall_clock: datetime.datetime, offset: typing.Optional[datetime.timedelta]) -> datetime.datetime:
+            # naive values stay wall clock, aware ones are converted by the EventPacket constructor
+            return wall_clock if offset is None else wall_clock.replace(tzinfo=datetime.timezone(offset))
+
+        return [
+            packet_cls((_attach(begin, begin_offset), _attach(end, end_offset)),
+                       summary, (False, self.timezone), location)
+            for begin, end, begin_offset, end_offset, summary, location in zip(
+                self.begin.astype(object), self.end.astype(object),
+                self.begin_offset.astype(object), self.end_offset.astype(object),
+                self.summary, self.location)
+        ]
@@ -0,0 +1,11 @@
+from event_packet import EventPacket
+
+
+def test_ordering_is_consistent_with_equality():
+    a = EventPacket.from_triple('2019-07-14T15:00:00', '2019-07-14T23:30:00', 'a')
+    b = EventPacket.from_triple('2019-07-14T15:00:00', '2019-07-14T23:30:00', 'b')
+
+    assert a != b
+    assert a < b and b > a
+    assert not (a > b) and not (b < a)
+    assert sorted([b, a]) == sorted([b, a], key=EventPacket.sort_key) == [a, b]
@@ -0,0 +1,35 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from event_packet import EventPacket
+from event_packet_batch import EventPacketBatch
+
+RESPONSES = [
+    {"start": {"dateTime": "2019-07-14T22:00:00Z"}, "end": {"dateTime": "2019-07-14T23:30:00-07:00"},
+     "summary": "utc and offset", "location": "home"},
+    {"start": {"dateTime": "2024-03-10T01:30:00-08:00"}, "end": {"dateTime": "2024-03-10T04:00:00-07:00"},
+     "summary": "across DST"},
+    {"start": {"dateTime": "2024-03-10T02:30:00"}, "end": {"dateTime": "2024-03-10T05:00:00"},
+     "summary": "naive inside the spring forward gap"},
+    {"start": {"dateTime": "2019-01-15T09:00:00"}, "end": {"dateTime": "2019-01-15T10:00:00.000+05:30"},
+     "summary": "naive and offset with a fraction"},
+]
+
+
+def test_to_packets_matches_from_freebusy():
+    batch = EventPacket.from_freebusy_many(RESPONSES)
+
+    for packet, response in zip(batch.to_packets(EventPacket), RESPONSES):
+        expected = EventPacket.from_freebusy(response)
+
+        assert packet == expected
+        assert (packet.begin, packet.end) == (expected.begin, expected.end)
+        assert packet.location == expected.location
+        assert packet.form_submit_body == expected.form_submit_body
+
+
+def test_time_elapsed():
+    batch = EventPacketBatch.from_freebusy_list(RESPONSES[:3])
+
+    assert batch.time_elapsed().tolist() == [30600, 5400, 9000]